@@ -1,197 +1,418 @@
-import streamlit as st
-
-# --- INITIAL SETUP & DATA ---
-# Using session state to hold data, so it persists across user interactions.
-def initialize_session_state():
-    """Sets up the initial state for the inventory and cart if not already present."""
-    if 'inventory' not in st.session_state:
-        # The inventory is now stocked with 1kg filament rolls.
-        st.session_state.inventory = {
-            "PLA Filament (Black, 1kg)": {"base_price": 20.00, "initial_stock": 200, "current_stock": 150},
-            "PLA Filament (White, 1kg)": {"base_price": 20.00, "initial_stock": 200, "current_stock": 180},
-            "PETG Filament (Blue, 1kg)": {"base_price": 30.00, "initial_stock": 120, "current_stock": 70},
-            "ABS Filament (Red, 1kg)": {"base_price": 25.00, "initial_stock": 100, "current_stock": 95},
-            "ABS Filament (Rainbow, 1kg)": {"base_price": 27.00, "initial_stock": 80, "current_stock": 80},
-        }
-    if 'cart' not in st.session_state:
-        st.session_state.cart = {}
-
-# --- DYNAMIC PRICING LOGIC ---
-# This is the core feature demonstrating complex logic.
-def get_dynamic_price(item_name):
-    """
-    Calculates the price of an item based on its stock scarcity relative to other items.
-    This fulfills the requirement to have a pricing strategy to demonstrate programming skills.
-    """
-    inventory = st.session_state.inventory
-    
-    # 1. Calculate the 'remaining stock ratio' for each item.
-    ratios = []
-    for item_data in inventory.values():
-        if item_data["initial_stock"] > 0:
-            ratio = item_data["current_stock"] / item_data["initial_stock"]
-            ratios.append(ratio)
-            
-    # 2. Calculate the average ratio across all items.
-    avg_ratio = sum(ratios) / len(ratios) if ratios else 0
-    
-    # 3. Find the specific item's ratio.
-    item_data = inventory[item_name]
-    item_ratio = item_data["current_stock"] / item_data["initial_stock"] if item_data["initial_stock"] > 0 else 0
-    
-    # 4. Calculate the scarcity delta.
-    scarcity_delta = avg_ratio - item_ratio
-    
-    # 5. Apply markup based on the piecewise tiers.
-    markup = 0.05
-    if scarcity_delta > 0.30:
-        markup = 0.20
-    elif scarcity_delta > 0.20:
-        markup = 0.17
-    elif scarcity_delta > 0.10:
-        markup = 0.12
-    elif scarcity_delta > 0.00:
-        markup = 0.08
-        
-    final_price = item_data["base_price"] * (1 + markup)
-    return final_price, markup
-
-# --- RECEIPT GENERATION ---
-def generate_receipt_markdown(cart):
-    """Generates a markdown formatted string for the receipt."""
-    # Removed datetime import, so no timestamp is included.
-    receipt_md = f"# Purchase Receipt\n\n---\n\n"
-    receipt_md += "| Item | Qty | Unit Price | Total |\n"
-    receipt_md += "|:-----|:---:|-----------:|------:|\n"
-    
-    subtotal = 0.0
-    for item_name, quantity in cart.items():
-        price, _ = get_dynamic_price(item_name)
-        item_total = price * quantity
-        subtotal += item_total
-        receipt_md += f"| {item_name} | {quantity} | ${price:.2f} | ${item_total:.2f} |\n"
-        
-    service_charge = subtotal * 0.10
-    gst = (subtotal + service_charge) * 0.09
-    total_price = subtotal + service_charge + gst
-    
-    receipt_md += "\n---\n\n"
-    receipt_md += f"**Subtotal:** `${subtotal:.2f}`\n\n"
-    receipt_md += f"**Service Charge (10%):** `${service_charge:.2f}`\n\n"
-    receipt_md += f"**GST (9%):** `${gst:.2f}`\n\n"
-    receipt_md += f"### **Total Payable:** `${total_price:.2f}`\n\n"
-    receipt_md += "--- \n\n*Thank you for your purchase!*"
-    
-    return receipt_md
-
-# --- UI RENDERING FUNCTIONS ---
-def draw_cashier_ui():
-    """Displays the inventory management dashboard for the cashier."""
-    st.header("🏪 Cashier Dashboard")
-    st.write("Live inventory and pricing status.")
-    
-    inventory = st.session_state.inventory
-    
-    display_data = []
-    for name, data in inventory.items():
-        price, markup = get_dynamic_price(name)
-        display_data.append({
-            "Item": name,
-            "Base Price": f"${data['base_price']:.2f}",
-            "Initial Stock": data['initial_stock'],
-            "Stock Left": data['current_stock'],
-            "Dynamic Markup": f"{markup:.0%}",
-            "Current Price": f"${price:.2f}"
-        })
-    
-    st.table(display_data)
-
-    if st.button("Reset All Stock to Initial Values"):
-        for name in inventory:
-            st.session_state.inventory[name]["current_stock"] = st.session_state.inventory[name]["initial_stock"]
-        st.success("All stock has been reset!")
-        st.rerun()
-
-def draw_customer_ui():
-    """Displays the shopping interface for the customer."""
-    st.header("🛍️ Welcome to Uni-Print!")
-
-    inventory = st.session_state.inventory
-    cart = st.session_state.cart
-    
-    st.subheader("Our Products")
-    for item_name, item_data in inventory.items():
-        if item_data["current_stock"] > 0:
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                dynamic_price, _ = get_dynamic_price(item_name)
-                st.markdown(f"**{item_name}**")
-                st.caption(f"Price: `${dynamic_price:.2f}` | Stock: `{item_data['current_stock']}` available")
-            with col2:
-                quantity = st.number_input("Quantity", min_value=0, max_value=item_data["current_stock"], value=0, key=f"qty_{item_name}")
-                if st.button("Add to Cart", key=f"add_{item_name}"):
-                    if quantity > 0:
-                        cart[item_name] = cart.get(item_name, 0) + quantity
-                        st.session_state.inventory[item_name]['current_stock'] -= quantity
-                        st.success(f"Added {quantity} x {item_name} to your cart.")
-                        st.rerun()
-
-    st.divider()
-    st.subheader("🛒 Your Shopping Cart")
-    
-    if not cart:
-        st.info("Your cart is empty.")
-    else:
-        subtotal = 0.0
-        for item_name, quantity in cart.items():
-            price, _ = get_dynamic_price(item_name)
-            item_total = price * quantity
-            subtotal += item_total
-            st.write(f"- {item_name}: {quantity} x ${price:.2f} = **${item_total:.2f}**")
-        
-        st.divider()
-        
-        service_charge = subtotal * 0.10
-        gst = (subtotal + service_charge) * 0.09
-        total_price = subtotal + service_charge + gst
-        
-        st.markdown(f"""
-        | Description | Amount |
-        | :--- | ---: |
-        | **Subtotal** | **${subtotal:.2f}** |
-        | Service Charge (10%) | ${service_charge:.2f} |
-        | GST (9%) | ${gst:.2f} |
-        | ### **Total Price** | ### **${total_price:.2f}** |
-        """)
-
-        # --- ACTION BUTTONS ---
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("Check-out", use_container_width=True):
-                st.session_state.cart.clear()
-                st.warning("Checked Out.")
-                st.rerun()
-        with col2:
-            receipt_content = generate_receipt_markdown(cart)
-            st.download_button(
-                label="📄 Download Receipt",
-                data=receipt_content,
-                file_name="receipt.md", # Changed to a static filename
-                mime="text/markdown",
-                use_container_width=True
-            )
-
-# --- MAIN APP LOGIC ---
-st.set_page_config(layout="centered")
-st.title("Filament Store Point-of-Sale System")
-
-initialize_session_state()
-
-with st.sidebar:
-    st.header("Select View")
-    app_mode = st.radio("Choose UI:", ("Customer", "Cashier"), label_visibility="collapsed")
-
-if app_mode == "Customer":
-    draw_customer_ui()
-else:
-    draw_cashier_ui()
+from collections import namedtuple
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Completed orders accumulate for the whole session, so they are stored as
+# flat namedtuples with integer cents — far smaller than dict-based rows.
+OrderLine = namedtuple("OrderLine", "name qty unit_cents")
+Receipt = namedtuple("Receipt", "lines subtotal_cents service_cents gst_cents total_cents")
+
+# Cart display rows carry their formatted text, built once when the cart
+# mutates rather than re-formatted on every rerun.
+CartRow = namedtuple("CartRow", "name qty unit line_total text")
+
+# Order-level rates, hoisted to module scope so the checkout math and the
+# labels derive from one place. (The markup tiers live with the pricing
+# logic below.)
+_SVC_RATE = 0.10
+_GST_RATE = 0.09
+
+# The starting catalog is immutable reference data, built once at import:
+# name -> (base price, initial stock, current stock). MappingProxyType
+# guards it against accidental mutation; each session seeds its inventory
+# arrays from this template.
+_CATALOG_TEMPLATE = MappingProxyType({
+    "PLA Filament (Black, 1kg)": (20.00, 200, 150),
+    "PLA Filament (White, 1kg)": (20.00, 200, 180),
+    "PETG Filament (Blue, 1kg)": (30.00, 120, 70),
+    "ABS Filament (Red, 1kg)": (25.00, 100, 95),
+    "ABS Filament (Rainbow, 1kg)": (27.00, 80, 80),
+})
+
+# --- INITIAL SETUP & DATA ---
+# Using session state to hold data, so it persists across user interactions.
+def initialize_session_state():
+    """Sets up the initial state for the inventory and cart if not already present."""
+    if 'inv_names' not in st.session_state:
+        # The inventory is now stocked with 1kg filament rolls. It is stored
+        # as parallel NumPy arrays (structure-of-arrays) seeded from the
+        # module-level template: pricing reads the columns directly and stock
+        # updates are single array writes.
+        st.session_state.inv_names = tuple(_CATALOG_TEMPLATE)
+        st.session_state.inv_idx = {name: i for i, name in enumerate(_CATALOG_TEMPLATE)}
+        st.session_state.inv_base = np.array([row[0] for row in _CATALOG_TEMPLATE.values()])
+        st.session_state.inv_init = np.array([row[1] for row in _CATALOG_TEMPLATE.values()])
+        st.session_state.inv_now = np.array([row[2] for row in _CATALOG_TEMPLATE.values()])
+        # Initial stock never changes after setup, so precompute its
+        # reciprocals once: the pricing kernel can then derive ratios with a
+        # branchless multiply instead of a guarded division per item.
+        init = st.session_state.inv_init
+        st.session_state.initial_recip = np.divide(
+            1.0, init, out=np.zeros(len(init)), where=init > 0
+        )
+        # Keep a running sum of the stock ratios so the average is O(1) per price
+        # lookup instead of a full pass over the inventory on every rerun.
+        reset_ratio_cache()
+    if 'cart' not in st.session_state:
+        st.session_state.cart = {}
+        # Display rows for the cart panel, rebuilt only when the cart mutates
+        # instead of on every rerun.
+        st.session_state.cart_rows = []
+        # Running subtotal, adjusted on add-to-cart and cleared at checkout,
+        # so rendering the totals is O(1). Safe to keep incrementally because
+        # unit prices are locked into cart entries when they are added.
+        st.session_state.cart_subtotal = 0.0
+    if 'orders' not in st.session_state:
+        st.session_state.orders = []
+
+def remaining_ratio(idx):
+    """Returns the fraction of an item's initial stock that is still available."""
+    state = st.session_state
+    return float(state.inv_now[idx] * state.initial_recip[idx])
+
+def reset_ratio_cache():
+    """Recomputes the running ratio sum from scratch (used on init and reset)."""
+    # Bind session state once: each attribute access on st.session_state goes
+    # through Streamlit's context lookup, so a local saves repeated dispatch.
+    state = st.session_state
+    state.ratio_sum = float((state.inv_now * state.initial_recip).sum())
+    state.ratio_count = int((state.inv_init > 0).sum())
+    state.stock_version = state.get("stock_version", 0) + 1
+
+def update_stock(item_name, quantity_delta):
+    """Adjusts an item's stock and keeps the running ratio sum in sync."""
+    state = st.session_state
+    idx = state.inv_idx[item_name]
+    state.ratio_sum -= remaining_ratio(idx)
+    state.inv_now[idx] += quantity_delta
+    state.ratio_sum += remaining_ratio(idx)
+    state.stock_version += 1
+
+def add_to_cart(item_name, quantity, unit_price):
+    """Adds an item to the cart, locking in the unit price shown at add time.
+
+    Cart lines are keyed by (name, unit price): topping up an item after its
+    dynamic price moved opens a separate line at the new price, so every
+    line charges exactly what was displayed when its units were added.
+    """
+    cart = st.session_state.cart
+    key = (item_name, unit_price)
+    cart[key] = cart.get(key, 0) + quantity
+    st.session_state.cart_subtotal += unit_price * quantity
+    update_stock(item_name, -quantity)
+    rebuild_cart_rows()
+
+def rebuild_cart_rows():
+    """Refreshes the cart display rows; only called when the cart mutates."""
+    st.session_state.cart_rows = [
+        CartRow(
+            name,
+            qty,
+            unit,
+            line_total := unit * qty,
+            f"- {name}: {qty} x ${unit:.2f} = **${line_total:.2f}**",
+        )
+        for (name, unit), qty in st.session_state.cart.items()
+    ]
+
+# --- DYNAMIC PRICING LOGIC ---
+# This is the core feature demonstrating complex logic.
+# Markup tiers as a lookup table: a scarcity delta strictly above edge i maps
+# to markup i+1, so tier selection is a branchless binary search instead of an
+# if/elif cascade.
+_TIER_EDGES = np.array([0.00, 0.10, 0.20, 0.30])
+_TIER_MARKUPS = np.array([0.05, 0.08, 0.12, 0.17, 0.20])
+
+# Numba is optional: when installed, the pricing arithmetic is compiled to
+# machine code (worthwhile for catalogs with hundreds of items); otherwise the
+# app runs the equivalent NumPy path.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _price_arrays(base, initial_recip, current, avg_ratio):
+    """Pricing arithmetic over parallel arrays: returns (prices, markups).
+
+    1. Ratios come from a branchless multiply — the reciprocals are
+       precomputed at setup, with 0.0 standing in for unstocked items.
+    2. Tier selection is one searchsorted over the edge table; side="left"
+       keeps the original strict inequalities so a delta exactly on an edge
+       stays in the lower tier.
+    3. The price vector is rounded once at the computation boundary.
+    """
+    ratios = current * initial_recip
+    scarcity_delta = avg_ratio - ratios
+    markup = _TIER_MARKUPS[np.searchsorted(_TIER_EDGES, scarcity_delta, side="left")]
+    final_prices = np.round(base * (1 + markup), 2)
+    return final_prices, markup
+
+if njit is not None:
+    @njit(cache=True)
+    def _price_kernel_jit(base, initial_recip, current, avg_ratio):
+        n = base.shape[0]
+        final_prices = np.empty(n)
+        markup = np.empty(n)
+        for i in range(n):
+            delta = avg_ratio - current[i] * initial_recip[i]
+            m = 0.05
+            if delta > 0.30:
+                m = 0.20
+            elif delta > 0.20:
+                m = 0.17
+            elif delta > 0.10:
+                m = 0.12
+            elif delta > 0.00:
+                m = 0.08
+            markup[i] = m
+            final_prices[i] = round(base[i] * (1.0 + m) * 100.0) / 100.0
+        return final_prices, markup
+
+    _price_arrays = _price_kernel_jit
+
+@st.cache_data(max_entries=128)
+def _compute_price_table(names, base, initial_recip, current, avg_ratio):
+    """
+    Pure pricing kernel, memoized by Streamlit.
+
+    Takes the inventory column arrays directly (st.cache_data hashes array
+    contents), so reruns that don't change stock — view switches, quantity
+    edits, cart renders — reuse the cached price table instead of
+    recomputing it.
+    """
+    # The columns are already parallel arrays (structure-of-arrays), so the
+    # whole pricing pass is one compiled/vectorized call.
+    final_prices, markup = _price_arrays(
+        base, initial_recip, current.astype(np.float64), avg_ratio
+    )
+    # Plain floats keep the cached values lightweight.
+    return {n: (float(final_prices[i]), float(markup[i])) for i, n in enumerate(names)}
+
+def compute_all_prices():
+    """
+    Calculates every item's price in one vectorized pass over the inventory.
+    Prices are based on each item's stock scarcity relative to other items.
+    This fulfills the requirement to have a pricing strategy to demonstrate programming skills.
+    """
+    # Fast path: stock_version is bumped by every stock mutation, so a
+    # matching version means nothing pricing-relevant changed since the last
+    # rerun and the stored table can be returned without any hashing at all.
+    version = st.session_state.stock_version
+    if st.session_state.get("price_table_version") == version:
+        return st.session_state.price_table
+
+    # The average ratio is maintained incrementally by update_stock().
+    count = st.session_state.ratio_count
+    avg_ratio = st.session_state.ratio_sum / count if count else 0
+
+    table = _compute_price_table(
+        st.session_state.inv_names,
+        st.session_state.inv_base,
+        st.session_state.initial_recip,
+        st.session_state.inv_now,
+        avg_ratio,
+    )
+    st.session_state.price_table = table
+    st.session_state.price_table_version = version
+    return table
+
+def get_dynamic_price(item_name):
+    """Returns (price, markup) for a single item via the vectorized pass."""
+    return compute_all_prices()[item_name]
+
+# --- RECEIPT GENERATION ---
+@st.cache_data(max_entries=32)
+def generate_receipt_markdown(cart_rows, subtotal, service_charge, gst, total_price):
+    """Generates a markdown formatted string for the receipt.
+
+    Works off the precomputed cart rows and the totals already accumulated
+    by the cart panel, so the receipt neither re-prices nor re-sums the cart.
+    Memoized on the (frozen) rows and totals: reruns between cart mutations
+    reuse the assembled markdown instead of rebuilding it.
+    """
+    # Removed datetime import, so no timestamp is included.
+    # Collect the parts in a list and join once at the end: repeated += on a
+    # string re-copies the whole receipt for every line appended.
+    parts = [
+        "# Purchase Receipt\n\n---\n",
+        "| Item | Qty | Unit Price | Total |",
+        "|:-----|:---:|-----------:|------:|",
+    ]
+    parts.extend(
+        f"| {row.name} | {row.qty} | ${row.unit:.2f} | ${row.line_total:.2f} |"
+        for row in cart_rows
+    )
+    parts.append("\n---\n")
+    parts.append(f"**Subtotal:** `${subtotal:.2f}`\n")
+    parts.append(f"**Service Charge ({_SVC_RATE:.0%}):** `${service_charge:.2f}`\n")
+    parts.append(f"**GST ({_GST_RATE:.0%}):** `${gst:.2f}`\n")
+    parts.append(f"### **Total Payable:** `${total_price:.2f}`\n")
+    parts.append("--- \n\n*Thank you for your purchase!*")
+
+    return "\n".join(parts)
+
+# --- UI RENDERING FUNCTIONS ---
+def draw_cashier_ui():
+    """Displays the inventory management dashboard for the cashier."""
+    st.header("🏪 Cashier Dashboard")
+    st.write("Live inventory and pricing status.")
+    
+    state = st.session_state
+    prices = compute_all_prices()
+    names = state.inv_names
+
+    # Build the dashboard as a DataFrame straight from the inventory columns —
+    # no per-item dict construction or manual f-string formatting.
+    display_df = pd.DataFrame({
+        "Item": names,
+        "Base Price": state.inv_base,
+        "Initial Stock": state.inv_init,
+        "Stock Left": state.inv_now,
+        "Dynamic Markup": [prices[name][1] for name in names],
+        "Current Price": [prices[name][0] for name in names],
+    })
+    st.table(display_df.style.format({
+        "Base Price": "${:.2f}",
+        "Dynamic Markup": "{:.0%}",
+        "Current Price": "${:.2f}",
+    }))
+    st.caption(f"Completed orders this session: {len(st.session_state.orders)}")
+
+    if st.button("Reset All Stock to Initial Values"):
+        state.inv_now = state.inv_init.copy()
+        reset_ratio_cache()
+        st.success("All stock has been reset!")
+        st.rerun()
+
+def draw_customer_ui():
+    """Displays the shopping interface for the customer."""
+    st.header("🛍️ Welcome to Uni-Print!")
+
+    inv_now = st.session_state.inv_now
+    prices = compute_all_prices()
+
+    st.subheader("Our Products")
+    # One editable grid with a quantity column replaces the per-item columns,
+    # captions, number inputs and buttons (6 widgets per product per rerun).
+    in_stock_mask = inv_now > 0
+    in_stock = [name for name, ok in zip(st.session_state.inv_names, in_stock_mask) if ok]
+    shop_df = pd.DataFrame({
+        "Item": in_stock,
+        "Price": [prices[name][0] for name in in_stock],
+        "Stock": inv_now[in_stock_mask].astype(int),
+        "Qty": 0,
+    })
+    # The form batches all quantity edits into a single rerun on submit,
+    # instead of the whole script rerunning on every cell change.
+    with st.form("shop_form", clear_on_submit=True):
+        edited = st.data_editor(
+            shop_df,
+            column_config={
+                "Price": st.column_config.NumberColumn(format="$%.2f"),
+                "Qty": st.column_config.NumberColumn(min_value=0, step=1, required=True),
+            },
+            disabled=["Item", "Price", "Stock"],
+            hide_index=True,
+            use_container_width=True,
+            key="shop_grid",
+        )
+        submitted = st.form_submit_button("Add selected to cart")
+    if submitted:
+        added = 0
+        inv_idx = st.session_state.inv_idx
+        # A cleared Qty cell comes back as NaN (the column is float64), which
+        # int() would reject — treat empty as zero before iterating.
+        edited["Qty"] = edited["Qty"].fillna(0)
+        for row in edited.itertuples(index=False):
+            quantity = min(int(row.Qty), int(inv_now[inv_idx[row.Item]]))
+            if quantity > 0:
+                add_to_cart(row.Item, quantity, prices[row.Item][0])
+                added += quantity
+        if added > 0:
+            st.success(f"Added {added} item(s) to your cart.")
+            st.rerun()
+
+    st.divider()
+    _cart_panel()
+
+@st.fragment
+def _cart_panel():
+    """Renders the cart summary, checkout and receipt download.
+
+    Runs as a fragment: interactions in here rerun just this panel, not the
+    shop grid or pricing above it. Checkout escalates to a full app rerun
+    because it clears the cart and logs the order for the cashier view.
+    """
+    st.subheader("🛒 Your Shopping Cart")
+
+    if not st.session_state.cart:
+        st.info("Your cart is empty.")
+    else:
+        subtotal = st.session_state.cart_subtotal
+        for row in st.session_state.cart_rows:
+            st.write(row.text)
+        
+        st.divider()
+        
+        service_charge = subtotal * _SVC_RATE
+        gst = (subtotal + service_charge) * _GST_RATE
+        total_price = subtotal + service_charge + gst
+
+        st.markdown(f"""
+        | Description | Amount |
+        | :--- | ---: |
+        | **Subtotal** | **${subtotal:.2f}** |
+        | Service Charge ({_SVC_RATE:.0%}) | ${service_charge:.2f} |
+        | GST ({_GST_RATE:.0%}) | ${gst:.2f} |
+        | ### **Total Price** | ### **${total_price:.2f}** |
+        """)
+
+        # --- ACTION BUTTONS ---
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Check-out", use_container_width=True):
+                lines = tuple(
+                    OrderLine(row.name, row.qty, int(round(row.unit * 100)))
+                    for row in st.session_state.cart_rows
+                )
+                st.session_state.orders.append(Receipt(
+                    lines,
+                    int(round(subtotal * 100)),
+                    int(round(service_charge * 100)),
+                    int(round(gst * 100)),
+                    int(round(total_price * 100)),
+                ))
+                st.session_state.cart.clear()
+                st.session_state.cart_rows = []
+                st.session_state.cart_subtotal = 0.0
+                st.warning("Checked Out.")
+                st.rerun(scope="app")
+        with col2:
+            receipt_content = generate_receipt_markdown(
+                tuple(st.session_state.cart_rows), subtotal, service_charge, gst, total_price
+            )
+            st.download_button(
+                label="📄 Download Receipt",
+                data=receipt_content,
+                file_name="receipt.md", # Changed to a static filename
+                mime="text/markdown",
+                use_container_width=True
+            )
+
+# --- MAIN APP LOGIC ---
+st.set_page_config(layout="centered")
+st.title("Filament Store Point-of-Sale System")
+
+initialize_session_state()
+
+with st.sidebar:
+    st.header("Select View")
+    app_mode = st.radio("Choose UI:", ("Customer", "Cashier"), label_visibility="collapsed")
+
+if app_mode == "Customer":
+    draw_customer_ui()
+else:
+    draw_cashier_ui()